@@ -2,11 +2,12 @@
 
 __all__ = ["Config", "ConnectorConfig"]
 
-import json
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import orjson
+
 
 @dataclass
 class Config:
@@ -49,14 +50,64 @@ class Config:
 class ConnectorConfig(ABC):
     """Connector configuration interface."""
 
+    def __post_init__(self) -> None:
+        """Initialize the serialization caches."""
+        self._json_cache: Optional[str] = None
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._topics_fingerprint: Optional[int] = None
+
     @abstractmethod
-    def update_config(self, topics: Set[str]) -> None:
+    def update_config(self, topics: Set[str]) -> bool:
         """Update connector configuration.
 
-        Abstract method to be implemented by subclasses.
+        Abstract method to be implemented by subclasses. Implementations
+        must call `invalidate_json_cache()` after changing configuration
+        values and return `True` if the configuration changed.
         """
         pass
 
+    def topics_changed(self, sorted_topics: List[str]) -> bool:
+        """Check if a topic list differs from the current configuration.
+
+        Fingerprints the sorted topic list and compares it against the
+        fingerprint of the last update. Updates the stored fingerprint
+        when the topics changed.
+
+        Parameters
+        ----------
+        sorted_topics : `List`
+            Sorted list of topic names.
+
+        Returns
+        -------
+        changed : `bool`
+            True if the topic list differs from the last update.
+        """
+        fingerprint = hash(tuple(sorted_topics))
+        if fingerprint == self._topics_fingerprint:
+            return False
+        self._topics_fingerprint = fingerprint
+        return True
+
+    def invalidate_json_cache(self, *fields: str) -> None:
+        """Invalidate the JSON returned by the `asjson()` method.
+
+        Called when the configuration changes, e.g. when the list of
+        topics is updated. If the names of the changed dataclass fields
+        are given, only those entries are refreshed in the cached
+        configuration dict, avoiding a full dataclass conversion on the
+        next `asjson()` call. Otherwise the whole dict is rebuilt.
+        """
+        self._json_cache = None
+        if self._dict_cache is None:
+            return
+        if fields:
+            for field in fields:
+                key = field.replace("_", ".")
+                self._dict_cache[key] = getattr(self, field)
+        else:
+            self._dict_cache = None
+
     @staticmethod
     def format_field_names(fields: List[Tuple[str, Any]]) -> Dict[str, str]:
         """Rename a field name by replacing '_' with '.'.
@@ -71,6 +122,18 @@ class ConnectorConfig(ABC):
         return dict(result)
 
     def asjson(self) -> str:
-        """Convert dataclass instance into JSON."""
-        config = asdict(self, dict_factory=self.format_field_names)
-        return json.dumps(config, indent=4, sort_keys=True)
+        """Convert dataclass instance into JSON.
+
+        The result is cached, repeated calls return the cached string
+        until the configuration is updated again.
+        """
+        if self._json_cache is None:
+            if self._dict_cache is None:
+                self._dict_cache = asdict(
+                    self, dict_factory=self.format_field_names
+                )
+            self._json_cache = orjson.dumps(
+                self._dict_cache,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+            ).decode()
+        return self._json_cache
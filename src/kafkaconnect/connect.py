@@ -6,12 +6,40 @@ See https://docs.confluent.io/current/connect/references/restapi.html.
 __all__ = ["Connect"]
 
 import json
+import re
 from enum import Enum
 from typing import Optional
 
-from requests import delete, get, post, put  # noqa
+import orjson
+from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 from requests.exceptions import ConnectionError, HTTPError
 
+_ERROR_COUNT_RE = re.compile(r'"error_count"\s*:\s*(\d+)')
+
+
+def extract_error_count(validation: str) -> int:
+    """Extract the error_count field from a validation response.
+
+    Uses a targeted regex search instead of parsing the entire JSON
+    payload, which can be large for connectors with many configuration
+    fields. Falls back to orjson.loads() for unexpected formats.
+
+    Parameters
+    ----------
+    validation : `str`
+        Response from the connector configuration validation.
+
+    Returns
+    -------
+    error_count : `int`
+        Number of validation errors.
+    """
+    match = _ERROR_COUNT_RE.search(validation)
+    if match:
+        return int(match.group(1))
+    return int(orjson.loads(validation)["error_count"])
+
 
 class HTTPMethod(Enum):
     """HTTP methods allowed."""
@@ -35,6 +63,19 @@ class Connect:
 
     def __init__(self, connect_url: str) -> None:
         self._connect_url = connect_url
+        # Reuse TCP connections across requests to the Connect API
+        self._session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the HTTP session and the pooled connections."""
+        self._session.close()
 
     def _request(
         self, method: HTTPMethod, uri: str, data: Optional[str] = None
@@ -61,12 +102,13 @@ class Connect:
                 raise ValueError(
                     f"data argument must be None with {method.name} method."
                 )
-        func = eval(method.value)
         try:
             if data:
-                response = func(uri, data=data, headers=Connect._header)
+                response = self._session.request(
+                    method.value, uri, data=data, headers=Connect._header
+                )
             else:
-                response = func(uri)
+                response = self._session.request(method.value, uri)
             response.raise_for_status()
         except HTTPError as err:
             if err.response.status_code == 404:
@@ -183,7 +225,7 @@ class Connect:
             connect_config=connect_config,
         )
 
-        error_count = json.loads(validation)["error_count"]
+        error_count = extract_error_count(validation)
         if error_count > 0:
             return validation
 
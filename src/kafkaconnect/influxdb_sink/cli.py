@@ -5,251 +5,269 @@ See https://docs.lenses.io/connectors/sink/influx.html.
 
 __all__ = ["create_influxdb_sink"]
 
-import json
+import atexit
+import os
+import re
+import signal
+import threading
 import time
-from typing import Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
 
 import click
 
-from kafkaconnect.connect import Connect
+from kafkaconnect.connect import Connect, extract_error_count
 from kafkaconnect.influxdb_sink.config import InfluxConfig
-from kafkaconnect.topic_names_set import TopicNamesSet
 
+# Environment variable and fallback value for each option not given on
+# the command line. Defaults are resolved in the command callback with
+# a single os.environ sweep instead of click's per-option envvar
+# machinery.
+_ENV_DEFAULTS = {
+    "name": ("KAFKA_CONNECT_NAME", "influxdb-sink"),
+    "connect_influx_url": (
+        "KAFKA_CONNECT_INFLUXDB_URL",
+        "http://localhost:8086",
+    ),
+    "connect_influx_db": ("KAFKA_CONNECT_DATABASE", "mydb"),
+    "tasks_max": ("KAFKA_CONNECT_TASKS_MAX", "1"),
+    "connect_influx_username": ("KAFKA_CONNECT_INFLUXDB_USERNAME", "-"),
+    "connect_influx_password": ("KAFKA_CONNECT_INFLUXDB_PASSWORD", ""),
+    "topic_regex": ("KAFKA_CONNECT_TOPIC_REGEX", ".*"),
+    "check_interval": ("KAFKA_CONNECT_CHECK_INTERVAL", "15000"),
+    "max_check_interval": ("KAFKA_CONNECT_MAX_CHECK_INTERVAL", "0"),
+    "debounce_interval": ("KAFKA_CONNECT_DEBOUNCE_INTERVAL", "0"),
+    "excluded_topic_regex": ("KAFKA_CONNECT_EXCLUDED_TOPIC_REGEX", ""),
+    "connect_influx_error_policy": ("KAFKA_CONNECT_ERROR_POLICY", "THROW"),
+    "connect_influx_max_retries": ("KAFKA_CONNECT_MAX_RETRIES", "10"),
+    "connect_influx_retry_interval": ("KAFKA_CONNECT_RETRY_INTERVAL", "60000"),
+    "connect_progress_enabled": ("KAFKA_CONNECT_PROGRESS_ENABLED", "false"),
+    "timestamp": ("KAFKA_CONNECT_INFLUXDB_TIMESTAMP", "sys_time()"),
+    "tags": ("KAFKA_CONNECT_INFLUXDB_TAGS", ""),
+    "remove_prefix": ("KAFKA_CONNECT_INFLUXDB_REMOVE_PREFIX", ""),
+}
 
-@click.command("influxdb-sink")
-@click.argument("topiclist", nargs=-1, required=False)
-@click.option(
-    "-n",
-    "--name",
-    "name",
-    envvar="KAFKA_CONNECT_NAME",
-    default="influxdb-sink",
-    show_default=True,
-    help=(
-        "Name of the connector."
-        "The connector name must be unique accross the cluster."
-        "Alternatively set via the $KAFKA_CONNECT_NAME env var."
+
+def _env_default(param: str) -> str:
+    """Resolve an option default from the environment."""
+    envvar, fallback = _ENV_DEFAULTS[param]
+    return os.environ.get(envvar, fallback)
+
+
+# Options for the influxdb-sink command, built once at module level
+# instead of a stack of @click.option decorator calls.
+_INFLUXDB_SINK_OPTIONS = (
+    click.Option(
+        ["-n", "--name", "name"],
+        default=None,
+        help=(
+            "Name of the connector."
+            "The connector name must be unique accross the cluster."
+            "Alternatively set via the $KAFKA_CONNECT_NAME env var."
+        ),
     ),
-)
-@click.option(
-    "-i",
-    "--influxdb_url",
-    "connect_influx_url",
-    envvar="KAFKA_CONNECT_INFLUXDB_URL",
-    default="http://localhost:8086",
-    show_default=True,
-    help=(
-        "InfluxDB connection URL. Alternatively set via the "
-        "$KAFKA_CONNECT_INFLUXDB_URL env var."
+    click.Option(
+        ["-i", "--influxdb_url", "connect_influx_url"],
+        default=None,
+        help=(
+            "InfluxDB connection URL. Alternatively set via the "
+            "$KAFKA_CONNECT_INFLUXDB_URL env var."
+        ),
     ),
-)
-@click.option(
-    "-d",
-    "--database",
-    "connect_influx_db",
-    envvar="KAFKA_CONNECT_DATABASE",
-    default="mydb",
-    show_default=True,
-    help=(
-        "InfluxDB database name. The database must exist at InfluxDB. "
-        "Alternatively set via the $KAFKA_CONNECT_DATABASE env var."
+    click.Option(
+        ["-d", "--database", "connect_influx_db"],
+        default=None,
+        help=(
+            "InfluxDB database name. The database must exist at InfluxDB. "
+            "Alternatively set via the $KAFKA_CONNECT_DATABASE env var."
+        ),
     ),
-)
-@click.option(
-    "-t",
-    "--tasks-max",
-    "tasks_max",
-    envvar="KAFKA_CONNECT_TASKS_MAX",
-    default="1",
-    show_default=True,
-    help=(
-        "Number of Kafka Connect tasks. Alternatively set via the "
-        "$KAFKA_CONNECT_TASKS_MAX env var."
+    click.Option(
+        ["-t", "--tasks-max", "tasks_max"],
+        default=None,
+        help=(
+            "Number of Kafka Connect tasks. Alternatively set via the "
+            "$KAFKA_CONNECT_TASKS_MAX env var."
+        ),
     ),
-)
-@click.option(
-    "-u",
-    "--username",
-    "connect_influx_username",
-    envvar="KAFKA_CONNECT_INFLUXDB_USERNAME",
-    default="-",
-    show_default=True,
-    help=(
-        "InfluxDB username. Alternatively set via the "
-        "$KAFKA_CONNECT_INFLUXDB_USERNAME env var. "
-        "Use '-' for unauthenticated users."
+    click.Option(
+        ["-u", "--username", "connect_influx_username"],
+        default=None,
+        help=(
+            "InfluxDB username. Alternatively set via the "
+            "$KAFKA_CONNECT_INFLUXDB_USERNAME env var. "
+            "Use '-' for unauthenticated users."
+        ),
     ),
-)
-@click.option(
-    "-p",
-    "--password",
-    "connect_influx_password",
-    envvar="KAFKA_CONNECT_INFLUXDB_PASSWORD",
-    default="",
-    show_default=True,
-    help=(
-        "InfluxDB password. Alternatively set via the "
-        "$KAFKA_CONNECT_INFLUXDB_PASSWORD env var."
+    click.Option(
+        ["-p", "--password", "connect_influx_password"],
+        default=None,
+        help=(
+            "InfluxDB password. Alternatively set via the "
+            "$KAFKA_CONNECT_INFLUXDB_PASSWORD env var."
+        ),
     ),
-)
-@click.option(
-    "-r",
-    "--topic-regex",
-    "topic_regex",
-    envvar="KAFKA_CONNECT_TOPIC_REGEX",
-    default=".*",
-    show_default=True,
-    help=(
-        "Regex for selecting topics. Alternatively set via the "
-        "$KAFKA_CONNECT_TOPIC_REGEX env var."
+    click.Option(
+        ["-r", "--topic-regex", "topic_regex"],
+        default=None,
+        help=(
+            "Regex for selecting topics. Alternatively set via the "
+            "$KAFKA_CONNECT_TOPIC_REGEX env var."
+        ),
     ),
-)
-@click.option(
-    "--dry-run",
-    is_flag=True,
-    help=(
-        "Show the InfluxDB Sink Connector configuration but do not create "
-        "the connector."
+    click.Option(
+        ["--dry-run"],
+        is_flag=True,
+        help=(
+            "Show the InfluxDB Sink Connector configuration but do not "
+            "create the connector."
+        ),
     ),
-)
-@click.option(
-    "--auto-update",
-    is_flag=True,
-    help=(
-        "Check for new topics and update the connector. See also the "
-        "--check-interval option."
+    click.Option(
+        ["--auto-update"],
+        is_flag=True,
+        help=(
+            "Check for new topics and update the connector. See also the "
+            "--check-interval option."
+        ),
     ),
-)
-@click.option(
-    "-v",
-    "--validate",
-    is_flag=True,
-    help="Validate the connector configuration before creating.",
-)
-@click.option(
-    "-c",
-    "--check-interval",
-    "check_interval",
-    envvar="KAFKA_CONNECT_CHECK_INTERVAL",
-    default="15000",
-    show_default=True,
-    help=(
-        "The interval, in milliseconds, to check for new topics and update"
-        "the connector. Alternatively set via the "
-        "$KAFKA_CONNECT_CHECK_INTERVAL env var."
+    click.Option(
+        ["-v", "--validate"],
+        is_flag=True,
+        help="Validate the connector configuration before creating.",
     ),
-)
-@click.option(
-    "-e",
-    "--excluded_topic_regex",
-    "excluded_topic_regex",
-    envvar="KAFKA_CONNECT_EXCLUDED_TOPIC_REGEX",
-    default="",
-    show_default=True,
-    help=(
-        "Regex for excluding topics. Alternatively set via the "
-        "$KAFKA_CONNECT_EXCLUDED_TOPIC_REGEX env var."
+    click.Option(
+        ["-c", "--check-interval", "check_interval"],
+        default=None,
+        help=(
+            "The interval, in milliseconds, to check for new topics and "
+            "update the connector. Alternatively set via the "
+            "$KAFKA_CONNECT_CHECK_INTERVAL env var."
+        ),
     ),
-)
-@click.option(
-    "--error-policy",
-    "connect_influx_error_policy",
-    type=click.Choice(["NOOP", "THROW", "RETRY"]),
-    envvar="KAFKA_CONNECT_ERROR_POLICY",
-    default="THROW",
-    show_default=True,
-    help=(
-        "Specifies the action to be taken if an error occurs while "
-        "inserting the data. There are three available options, NOOP, "
-        "the error is swallowed, THROW, the error is allowed to propagate "
-        "and RETRY. For RETRY the Kafka message is redelivered up to a "
-        "maximum number of times specified by the ``--max-retries`` option. "
-        "The retry interval is specified by the ``--retry-interval`` option. "
-        "Alternatively set via the $KAFKA_CONNECT_ERROR_POLICY env var."
+    click.Option(
+        ["--max-check-interval", "max_check_interval"],
+        default=None,
+        help=(
+            "The maximum interval, in milliseconds, to check for new "
+            "topics. If larger than --check-interval, the check interval "
+            "backs off towards this value while no new topics are found "
+            "and resets when new topics appear. Alternatively set via the "
+            "$KAFKA_CONNECT_MAX_CHECK_INTERVAL env var."
+        ),
     ),
-)
-@click.option(
-    "--max-retries",
-    "connect_influx_max_retries",
-    envvar="KAFKA_CONNECT_MAX_RETRIES",
-    default="10",
-    show_default=True,
-    help=(
-        "The maximum number of times a message is retried. Only valid when "
-        "the ``--error-policy`` is set to RETRY. Alternatively set via the "
-        "$KAFKA_CONNECT_MAX_RETRIES env var."
+    click.Option(
+        ["--debounce-interval", "debounce_interval"],
+        default=None,
+        help=(
+            "The time, in milliseconds, to wait after the last new topic "
+            "is found before updating the connector. Topics found within "
+            "this window are coalesced into a single update. Alternatively "
+            "set via the $KAFKA_CONNECT_DEBOUNCE_INTERVAL env var."
+        ),
     ),
-)
-@click.option(
-    "--retry-interval",
-    "connect_influx_retry_interval",
-    envvar="KAFKA_CONNECT_RETRY_INTERVAL",
-    default="60000",
-    show_default=True,
-    help=(
-        "The interval, in milliseconds between retries. Only valid when "
-        "the ``--error-policy`` is set to RETRY. Alternatively set via the "
-        "$KAFKA_CONNECT_RETRY_INTERVAL env var."
+    click.Option(
+        ["-e", "--excluded_topic_regex", "excluded_topic_regex"],
+        default=None,
+        help=(
+            "Regex for excluding topics. Alternatively set via the "
+            "$KAFKA_CONNECT_EXCLUDED_TOPIC_REGEX env var."
+        ),
     ),
-)
-@click.option(
-    "--progress-enabled",
-    "connect_progress_enabled",
-    envvar="KAFKA_CONNECT_PROGRESS_ENABLED",
-    default="false",
-    show_default=True,
-    help=(
-        "Enables the output for how many records have been processed. "
-        "Alternatively set via the $KAFKA_CONNECT_PROGRESS_ENABLED env var."
+    click.Option(
+        ["--error-policy", "connect_influx_error_policy"],
+        type=click.Choice(["NOOP", "THROW", "RETRY"]),
+        default=None,
+        help=(
+            "Specifies the action to be taken if an error occurs while "
+            "inserting the data. There are three available options, NOOP, "
+            "the error is swallowed, THROW, the error is allowed to "
+            "propagate and RETRY. For RETRY the Kafka message is "
+            "redelivered up to a maximum number of times specified by the "
+            "``--max-retries`` option. The retry interval is specified by "
+            "the ``--retry-interval`` option. Alternatively set via the "
+            "$KAFKA_CONNECT_ERROR_POLICY env var."
+        ),
+    ),
+    click.Option(
+        ["--max-retries", "connect_influx_max_retries"],
+        default=None,
+        help=(
+            "The maximum number of times a message is retried. Only valid "
+            "when the ``--error-policy`` is set to RETRY. Alternatively "
+            "set via the $KAFKA_CONNECT_MAX_RETRIES env var."
+        ),
+    ),
+    click.Option(
+        ["--retry-interval", "connect_influx_retry_interval"],
+        default=None,
+        help=(
+            "The interval, in milliseconds between retries. Only valid "
+            "when the ``--error-policy`` is set to RETRY. Alternatively "
+            "set via the $KAFKA_CONNECT_RETRY_INTERVAL env var."
+        ),
+    ),
+    click.Option(
+        ["--progress-enabled", "connect_progress_enabled"],
+        default=None,
+        help=(
+            "Enables the output for how many records have been processed. "
+            "Alternatively set via the $KAFKA_CONNECT_PROGRESS_ENABLED "
+            "env var."
+        ),
+    ),
+    click.Option(
+        ["--timestamp", "timestamp"],
+        default=None,
+        help="Timestamp to use as the InfluxDB time.",
+    ),
+    click.Option(
+        ["--tags", "tags"],
+        default=None,
+        help="Fields in the Avro payload that are treated as InfluxDB tags.",
+    ),
+    click.Option(
+        ["--remove-prefix", "remove_prefix"],
+        default=None,
+        help="Prefix to remove from topic name to use as measurement name.",
     ),
 )
-@click.option(
-    "--timestamp",
-    "timestamp",
-    envvar="KAFKA_CONNECT_INFLUXDB_TIMESTAMP",
-    default="sys_time()",
-    show_default=True,
-    help="Timestamp to use as the InfluxDB time.",
-)
-@click.option(
-    "--tags",
-    "tags",
-    envvar="KAFKA_CONNECT_INFLUXDB_TAGS",
-    default="",
-    show_default=True,
-    help="Fields in the Avro payload that are treated as InfluxDB tags.",
-)
-@click.option(
-    "--remove-prefix",
-    "remove_prefix",
-    envvar="KAFKA_CONNECT_INFLUXDB_REMOVE_PREFIX",
-    default="",
-    show_default=True,
-    help="Prefix to remove from topic name to use as measurement name.",
-)
+
+
+def _add_options(command: click.Command) -> click.Command:
+    """Add the influxdb-sink options to the command."""
+    command.params.extend(_INFLUXDB_SINK_OPTIONS)
+    return command
+
+
+@_add_options
+@click.command("influxdb-sink")
+@click.argument("topiclist", nargs=-1, required=False)
 @click.pass_context
 def create_influxdb_sink(
     ctx: click.Context,
     topiclist: tuple,
-    name: str,
-    connect_influx_url: str,
-    connect_influx_db: str,
-    tasks_max: str,
-    connect_influx_username: str,
-    connect_influx_password: str,
-    topic_regex: str,
+    name: Optional[str],
+    connect_influx_url: Optional[str],
+    connect_influx_db: Optional[str],
+    tasks_max: Optional[str],
+    connect_influx_username: Optional[str],
+    connect_influx_password: Optional[str],
+    topic_regex: Optional[str],
     dry_run: bool,
     auto_update: bool,
     validate: bool,
-    check_interval: str,
-    excluded_topic_regex: str,
-    connect_influx_error_policy: str,
-    connect_influx_max_retries: str,
-    connect_influx_retry_interval: str,
-    connect_progress_enabled: str,
-    timestamp: str,
-    tags: str,
-    remove_prefix: str,
+    check_interval: Optional[str],
+    max_check_interval: Optional[str],
+    debounce_interval: Optional[str],
+    excluded_topic_regex: Optional[str],
+    connect_influx_error_policy: Optional[str],
+    connect_influx_max_retries: Optional[str],
+    connect_influx_retry_interval: Optional[str],
+    connect_progress_enabled: Optional[str],
+    timestamp: Optional[str],
+    tags: Optional[str],
+    remove_prefix: Optional[str],
 ) -> int:
     """Create an instance of the InfluxDB Sink connector.
 
@@ -260,6 +278,48 @@ def create_influxdb_sink(
     the connector configuration use the
     ``--auto-update`` and ``--check-interval`` options.
     """
+    # Resolve options not given on the command line from the
+    # environment, falling back to the documented defaults
+    if name is None:
+        name = _env_default("name")
+    if connect_influx_url is None:
+        connect_influx_url = _env_default("connect_influx_url")
+    if connect_influx_db is None:
+        connect_influx_db = _env_default("connect_influx_db")
+    if tasks_max is None:
+        tasks_max = _env_default("tasks_max")
+    if connect_influx_username is None:
+        connect_influx_username = _env_default("connect_influx_username")
+    if connect_influx_password is None:
+        connect_influx_password = _env_default("connect_influx_password")
+    if topic_regex is None:
+        topic_regex = _env_default("topic_regex")
+    if check_interval is None:
+        check_interval = _env_default("check_interval")
+    if max_check_interval is None:
+        max_check_interval = _env_default("max_check_interval")
+    if debounce_interval is None:
+        debounce_interval = _env_default("debounce_interval")
+    if excluded_topic_regex is None:
+        excluded_topic_regex = _env_default("excluded_topic_regex")
+    if connect_influx_error_policy is None:
+        connect_influx_error_policy = _env_default(
+            "connect_influx_error_policy"
+        )
+    if connect_influx_max_retries is None:
+        connect_influx_max_retries = _env_default("connect_influx_max_retries")
+    if connect_influx_retry_interval is None:
+        connect_influx_retry_interval = _env_default(
+            "connect_influx_retry_interval"
+        )
+    if connect_progress_enabled is None:
+        connect_progress_enabled = _env_default("connect_progress_enabled")
+    if timestamp is None:
+        timestamp = _env_default("timestamp")
+    if tags is None:
+        tags = _env_default("tags")
+    if remove_prefix is None:
+        remove_prefix = _env_default("remove_prefix")
     # Get configuration from the main command
     if ctx.parent:
         config = ctx.parent.obj["config"]
@@ -278,37 +338,70 @@ def create_influxdb_sink(
         tags=tags,
         remove_prefix=remove_prefix,
     )
+    # Compile the topic selection patterns once, they are reused on
+    # every auto-update check
+    select_pattern = re.compile(topic_regex)
+    exclude_pattern: Optional[re.Pattern] = None
+    if excluded_topic_regex:
+        exclude_pattern = re.compile(excluded_topic_regex)
+    connect = Connect(connect_url=config.connect_url)
+    atexit.register(connect.close)
     # The variadic argument is a tuple
     topics: Set[str] = set(topiclist)
     if not topics:
+        # Import here so that invocations with an explicit TOPICLIST do
+        # not pay for loading the Kafka client
+        from kafkaconnect.topic_names_set import TopicNamesSet
+
         click.echo("Discoverying Kafka topics...")
-        t = TopicNamesSet.from_kafka(config, topic_regex, excluded_topic_regex)
+        # Overlap the Kafka metadata request with a Connect API call
+        # that warms the HTTP connection pool and fetches the list of
+        # connector plugins
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            topic_future = executor.submit(
+                TopicNamesSet.from_kafka,
+                config,
+                select_pattern,
+                exclude_pattern,
+            )
+            plugins_future = executor.submit(connect.plugins)
+            t = topic_future.result()
+            plugins = plugins_future.result()
+        # Warn if the connector plugin is not installed in the Connect
+        # cluster, skipping the check if the request itself failed
+        if plugins.startswith("[") and (
+            influx_config.connector_class not in plugins
+        ):
+            click.echo(
+                f"Warning: {influx_config.connector_class} not found "
+                "in the list of connector plugins."
+            )
         topics = t.topic_names_set
-        n = 0 if not topics else len(topics)
+        n = len(topics)
         click.echo(f"Found {n} topics.")
-    connect = Connect(connect_url=config.connect_url)
     if topics:
         influx_config.update_config(topics, timestamp)
+        payload = influx_config.asjson()
         # --validate option returns the validation results
         if validate:
             click.echo(
                 connect.validate(
                     name=influx_config.connector_class,
-                    connect_config=influx_config.asjson(),
+                    connect_config=payload,
                 )
             )
             return 0
         # --dry-run option returns the connector configuration
         if dry_run:
-            click.echo(influx_config.asjson())
+            click.echo(payload)
             return 0
         # Validate configuration before creating the connector
         validation = connect.validate(
             name=influx_config.connector_class,
-            connect_config=influx_config.asjson(),
+            connect_config=payload,
         )
         try:
-            error_count = json.loads(validation)["error_count"]
+            error_count = extract_error_count(validation)
             click.echo(f"Validation returned {error_count} error(s).")
             if error_count > 0:
                 click.echo(
@@ -320,26 +413,50 @@ def create_influxdb_sink(
             click.echo(validation)
             return 1
         click.echo(f"Uploading {name} connector configuration...")
-        connect.create_or_update(
-            name=name, connect_config=influx_config.asjson()
-        )
+        connect.create_or_update(name=name, connect_config=payload)
     if auto_update:
-        while True:
-            time.sleep(int(check_interval) / 1000)
-            try:
-                # Current list of topics from Kafka
-                t = TopicNamesSet.from_kafka(
-                    config, topic_regex, excluded_topic_regex
-                )
-                current_topics = t.topic_names_set
-                new_topics = list(set(current_topics) - set(topics))
-                if new_topics:
-                    click.echo("Found new topics, updating the connector...")
-                    influx_config.update_config(current_topics, timestamp)
+        # Free if already imported during topic discovery
+        from kafkaconnect.topic_names_set import TopicNamesSet
+
+        # Topics known so far, diffed against Kafka on every check
+        known_topics = set(topics)
+        # Topics found but not yet pushed to the connector
+        pending_topics: Set[str] = set()
+        last_change = 0.0
+        interval = int(check_interval)
+        max_interval = max(int(max_check_interval), interval)
+        debounce = int(debounce_interval) / 1000
+        # Wake up promptly on SIGINT instead of blocking in time.sleep()
+        stop = threading.Event()
+        signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+        while not stop.wait(interval / 1000):
+            # Current list of topics from Kafka
+            t = TopicNamesSet.from_kafka(
+                config, select_pattern, exclude_pattern
+            )
+            current_topics = t.topic_names_set
+            new_topics = current_topics - known_topics
+            if new_topics:
+                click.echo("Found new topics.")
+                known_topics |= new_topics
+                pending_topics |= new_topics
+                last_change = time.monotonic()
+                interval = int(check_interval)
+            else:
+                # Back off while no new topics arrive
+                interval = min(interval * 2, max_interval)
+            # Coalesce topics found within the debounce window into a
+            # single connector update
+            if pending_topics and (
+                time.monotonic() - last_change >= debounce
+            ):
+                # Skip the update if the resulting topic set is
+                # identical to the current configuration
+                if influx_config.update_config(current_topics, timestamp):
+                    click.echo("Updating the connector...")
                     connect.create_or_update(
                         name=name, connect_config=influx_config.asjson()
                     )
-                    topics = current_topics
-            except KeyboardInterrupt:
-                raise click.ClickException("Interruped.")
+                pending_topics.clear()
+        raise click.ClickException("Interruped.")
     return 0
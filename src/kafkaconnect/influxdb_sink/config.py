@@ -68,7 +68,7 @@ class InfluxConfig(ConnectorConfig):
     )
     """Stream reactor InfluxDB Sink connector class."""
 
-    def update_config(self, topics: Set[str], timestamp: str = "") -> None:
+    def update_config(self, topics: Set[str], timestamp: str = "") -> bool:
         """Update connector config.
 
         Parameters
@@ -78,8 +78,16 @@ class InfluxConfig(ConnectorConfig):
 
         timestamp : `str`
             Timestamp used as influxDB time.
+
+        Returns
+        -------
+        updated : `bool`
+            True if the configuration changed, False if the topic set
+            is identical to the current configuration.
         """
         sorted_topics = sorted(topics)
+        if not self.topics_changed(sorted_topics):
+            return False
         self.topics = ",".join(sorted_topics)
 
         tags = ""
@@ -101,3 +109,5 @@ class InfluxConfig(ConnectorConfig):
             queries.append(query)
 
         self.connect_influx_kcql = ";".join(queries)
+        self.invalidate_json_cache("topics", "connect_influx_kcql")
+        return True
@@ -4,7 +4,7 @@ __all__ = ["TopicNamesSet"]
 
 import logging
 import re
-from typing import List, Optional, Set, Type, TypeVar
+from typing import AbstractSet, List, Optional, Set, Type, TypeVar, Union
 
 from confluent_kafka import KafkaException
 from confluent_kafka.admin import AdminClient
@@ -27,10 +27,15 @@ class TopicNamesSet:
     ----------
     topic_names_list : `List`
         A list topic names
-    select_regex : `str`
-        A regex to add topic names to the set.
-    exclude_regex : `str`
-        A regex to exclude topic names from the set.
+    select_regex : `str` or `re.Pattern`
+        A regex to add topic names to the set. A precompiled pattern
+        can be passed to avoid recompiling the regex on repeated calls.
+    exclude_regex : `str`, `re.Pattern` or `Set`
+        A regex to exclude topic names from the set. A precompiled
+        pattern can be passed to avoid recompiling the regex on
+        repeated calls. A set of exact topic names can also be passed,
+        in which case membership is tested directly without regex
+        matching.
 
 
     Raises
@@ -44,45 +49,60 @@ class TopicNamesSet:
     def __init__(
         self,
         topic_names_list: List,
-        select_regex: str = ".*",
-        exclude_regex: Optional[str] = None,
+        select_regex: Union[str, re.Pattern] = ".*",
+        exclude_regex: Optional[
+            Union[str, re.Pattern, AbstractSet[str]]
+        ] = None,
     ) -> None:
         self.topic_names_list = topic_names_list
         self.select_regex = select_regex
         self.exclude_regex = exclude_regex
         self.topic_names_set = self.filter_topics()
 
+    @staticmethod
+    def _compile(regex: Union[str, re.Pattern]) -> re.Pattern:
+        """Compile a regex, bypassing compilation for precompiled patterns."""
+        if isinstance(regex, re.Pattern):
+            return regex
+        return re.compile(regex)
+
     def filter_topics(self) -> Set[str]:
         """Filter a list of topic names.
 
+        Topic names are filtered in a single pass over the list, without
+        building intermediate sets.
+
         Returns
         -------
         topic_names_set: `Set`
             A a set of topic names.
         """
-        topic_names_set = set(self.topic_names_list)
-
+        select = None
         if self.select_regex:
-            pattern = re.compile(self.select_regex)
-            topic_names_set = {
-                topic for topic in topic_names_set if pattern.match(topic)
-            }
-
-        if self.exclude_regex:
-            pattern = re.compile(self.exclude_regex)
-            excluded_topic_names = {
-                topic for topic in topic_names_set if pattern.match(topic)
-            }
-            topic_names_set = topic_names_set - excluded_topic_names
-
-        return topic_names_set
+            select = self._compile(self.select_regex)
+        exclude = None
+        excluded_names = None
+        if isinstance(self.exclude_regex, AbstractSet):
+            excluded_names = self.exclude_regex
+        elif self.exclude_regex:
+            exclude = self._compile(self.exclude_regex)
+
+        return {
+            topic
+            for topic in self.topic_names_list
+            if (select is None or select.match(topic))
+            and (exclude is None or not exclude.match(topic))
+            and (excluded_names is None or topic not in excluded_names)
+        }
 
     @classmethod
     def from_kafka(
         cls: Type[T],
         config: Config,
-        select_regex: str = ".*",
-        exclude_regex: Optional[str] = None,
+        select_regex: Union[str, re.Pattern] = ".*",
+        exclude_regex: Optional[
+            Union[str, re.Pattern, AbstractSet[str]]
+        ] = None,
     ) -> T:
         """Create the topic name set from a list of topic names in Kafka."""
         if config.sasl_plain_username and config.sasl_plain_password:
@@ -0,0 +1,30 @@
+"""Tests for the connector configuration."""
+
+from kafkaconnect.influxdb_sink.config import InfluxConfig
+
+
+def test_asjson_updated_topics() -> None:
+    """Test that asjson() reflects successive topic updates."""
+    connect_config = InfluxConfig(
+        name="influxdb-sink",
+        connect_influx_url="http://localhost:8086",
+        connect_influx_db="mydb",
+        tasks_max=1,
+        connect_influx_username="foo",
+        connect_influx_password="bar",
+        connect_influx_error_policy="THROW",
+        connect_influx_max_retries="10",
+        connect_influx_retry_interval="60000",
+        connect_progress_enabled=True,
+        tags="",
+        remove_prefix="",
+    )
+    assert connect_config.update_config({"t1"})
+    assert '"topics": "t1"' in connect_config.asjson()
+
+    assert connect_config.update_config({"t1", "t2"})
+    assert '"topics": "t1,t2"' in connect_config.asjson()
+    assert "INSERT INTO t2" in connect_config.asjson()
+
+    # Updating with an identical topic set is a no-op
+    assert not connect_config.update_config({"t2", "t1"})
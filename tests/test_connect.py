@@ -2,7 +2,7 @@
 
 import pytest
 
-from kafkaconnect.connect import Connect, HTTPMethod
+from kafkaconnect.connect import Connect, HTTPMethod, extract_error_count
 from kafkaconnect.influxdb_sink.config import InfluxConfig
 
 
@@ -24,6 +24,12 @@ def test_expected_exception_delete() -> None:
         )
 
 
+def test_extract_error_count() -> None:
+    """Test extracting error_count from a validation response."""
+    validation = '{\n    "error_count": 2,\n    "name": "connector"\n}'
+    assert extract_error_count(validation) == 2
+
+
 @pytest.mark.vcr
 def test_list() -> None:
     """Test list method."""
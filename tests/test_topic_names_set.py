@@ -1,5 +1,6 @@
 """Tests for the Topic class."""
 
+import re
 from typing import Any, List
 
 import pytest
@@ -55,6 +56,32 @@ def test_exclude_regex_topic_name(topic_names_list: Fixture) -> None:
     assert "test.t3" in t.topic_names_set
 
 
+def test_precompiled_patterns(topic_names_list: Fixture) -> None:
+    """Test topic selection and exclusion using precompiled patterns."""
+    t = TopicNamesSet(
+        topic_names_list,
+        select_regex=re.compile("test.*"),
+        exclude_regex=re.compile("test.t2"),
+    )
+
+    assert "test.t1" in t.topic_names_set
+    assert "test.t2" not in t.topic_names_set
+    assert "test.t3" in t.topic_names_set
+
+
+def test_exclude_topic_name_set(topic_names_list: Fixture) -> None:
+    """Test topic exclusion using a set of exact topic names."""
+    t = TopicNamesSet(
+        topic_names_list,
+        select_regex="test.*",
+        exclude_regex=frozenset({"test.t1", "test.t3"}),
+    )
+
+    assert "test.t1" not in t.topic_names_set
+    assert "test.t2" in t.topic_names_set
+    assert "test.t3" not in t.topic_names_set
+
+
 def test_exclude_all(topic_names_list: Fixture) -> None:
     """Test selecting and excluding all topics."""
     t = TopicNamesSet(